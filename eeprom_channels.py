@@ -0,0 +1,265 @@
+# ---------------------------
+# Разбор полного дампа EEPROM UV-K5 (-rdee) в таблицу каналов
+# ---------------------------
+# Раскладка стоковой прошивки:
+#   0x0000  200 каналов по 16 байт (частота, смещение, коды, флаги)
+#   0x0D60  200 байт атрибутов каналов (списки сканирования, компандер, диапазон)
+#   0x0E70  16 байт основных настроек
+#   0x0F50  200 имён каналов по 16 байт (10 символов + 6 резервных)
+# Все массивы — представления numpy поверх одного bytearray, поэтому
+# правка колонки сразу меняет образ, а to_bytes() отдаёт готовый файл для -wree.
+import numpy as np
+
+CHANNEL_COUNT = 200
+DUMP_SIZE = 0x2000
+
+CHANNELS_OFFSET = 0x0000
+ATTRIBUTES_OFFSET = 0x0D60
+SETTINGS_OFFSET = 0x0E70
+NAMES_OFFSET = 0x0F50
+NAME_LENGTH = 10
+
+CHANNEL_DTYPE = np.dtype([
+    ('freq', '<u4'),        # частота приёма, единицы 10 Гц
+    ('offset', '<u4'),      # смещение передачи, единицы 10 Гц
+    ('rxcode', 'u1'),
+    ('txcode', 'u1'),
+    ('codeflags', 'u1'),    # tx_code_type:4 | rx_code_type:4
+    ('modshift', 'u1'),     # modulation:4 | shift:4
+    ('flags', 'u1'),        # -:3 | busy_lock:1 | power:2 | bandwidth:1 | reverse:1
+    ('dtmf', 'u1'),         # -:4 | ptt_id:3 | dtmf_decode:1
+    ('step', 'u1'),
+    ('scrambler', 'u1'),
+])
+
+NAME_DTYPE = np.dtype([
+    ('name', f'S{NAME_LENGTH}'),
+    ('reserved', 'V6'),
+])
+
+SETTINGS_DTYPE = np.dtype([
+    ('call_channel', 'u1'),
+    ('squelch', 'u1'),
+    ('max_talk_time', 'u1'),
+    ('noaa_autoscan', 'u1'),
+    ('key_lock', 'u1'),
+    ('vox_switch', 'u1'),
+    ('vox_level', 'u1'),
+    ('mic_gain', 'u1'),
+    ('unknown', 'u1'),
+    ('channel_display_mode', 'u1'),
+    ('crossband', 'u1'),
+    ('battery_save', 'u1'),
+    ('dual_watch', 'u1'),
+    ('backlight_auto_mode', 'u1'),
+    ('tail_note_elimination', 'u1'),
+    ('vfo_open', 'u1'),
+])
+
+# Битовые поля: колонка -> (массив, сырое поле, сдвиг, ширина)
+BITFIELDS = {
+    'rx_code_type': ('channels', 'codeflags', 0, 4),
+    'tx_code_type': ('channels', 'codeflags', 4, 4),
+    'shift': ('channels', 'modshift', 0, 4),
+    'modulation': ('channels', 'modshift', 4, 4),
+    'reverse': ('channels', 'flags', 0, 1),
+    'bandwidth': ('channels', 'flags', 1, 1),
+    'power': ('channels', 'flags', 2, 2),
+    'busy_lock': ('channels', 'flags', 4, 1),
+    'dtmf_decode': ('channels', 'dtmf', 0, 1),
+    'ptt_id': ('channels', 'dtmf', 1, 3),
+    'band': ('attributes', None, 0, 3),
+    'compander': ('attributes', None, 4, 2),
+    'scanlist2': ('attributes', None, 6, 1),
+    'scanlist1': ('attributes', None, 7, 1),
+}
+
+# Диапазоны стоковой прошивки, Гц (номер диапазона = индекс, границы включительно).
+# Прошивка выбирает диапазон канала по битам band и сверяет с ним частоту.
+BANDS = np.array([
+    (50_000_000, 76_000_000),
+    (108_000_000, 135_999_990),
+    (136_000_000, 173_999_990),
+    (174_000_000, 349_999_990),
+    (350_000_000, 399_999_990),
+    (400_000_000, 469_999_990),
+    (470_000_000, 600_000_000),
+], dtype=np.int64)
+
+# Целые байтовые поля канала
+BYTE_FIELDS = ('rxcode', 'txcode', 'step', 'scrambler')
+
+# Частоты хранятся в единицах 10 Гц, наружу отдаются в Гц
+FREQUENCY_FIELDS = {'frequency': 'freq', 'offset': 'offset'}
+
+COLUMNS = (
+    'name', 'frequency', 'offset', 'shift', 'power', 'modulation', 'bandwidth',
+    'rx_code_type', 'rxcode', 'tx_code_type', 'txcode', 'step', 'scrambler',
+    'busy_lock', 'reverse', 'dtmf_decode', 'ptt_id',
+    'scanlist1', 'scanlist2', 'compander', 'band',
+)
+
+# Колонки только для чтения: band пересчитывается из частоты
+READ_ONLY_COLUMNS = ('band',)
+
+# Номер диапазона, которым прошивка помечает недействительный канал
+INVALID_BAND = 7
+
+# Текстовые значения для перечислимых колонок (индекс = сырое значение)
+CHOICES = {
+    'power': ('Low', 'Mid', 'High'),
+    'modulation': ('FM', 'AM', 'USB'),
+    'shift': ('', '+', '-'),
+    'bandwidth': ('Wide', 'Narrow'),
+    'rx_code_type': ('', 'CTCSS', 'DCS', 'DCS-R'),
+    'tx_code_type': ('', 'CTCSS', 'DCS', 'DCS-R'),
+}
+
+
+class ChannelTable:
+    def __init__(self, data):
+        if len(data) < DUMP_SIZE:
+            raise ValueError(f"Дамп слишком короткий: {len(data)} байт, ожидается {DUMP_SIZE}")
+        self._data = bytearray(data)
+        self.channels = np.frombuffer(self._data, CHANNEL_DTYPE, CHANNEL_COUNT, CHANNELS_OFFSET)
+        self.attributes = np.frombuffer(self._data, np.uint8, CHANNEL_COUNT, ATTRIBUTES_OFFSET)
+        self.names = np.frombuffer(self._data, NAME_DTYPE, CHANNEL_COUNT, NAMES_OFFSET)
+        self.settings = np.frombuffer(self._data, SETTINGS_DTYPE, 1, SETTINGS_OFFSET)
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self._data)
+
+    def to_bytes(self):
+        return bytes(self._data)
+
+    def __len__(self):
+        return CHANNEL_COUNT
+
+    # ---------------------------
+    # Занятые каналы
+    # ---------------------------
+    def used(self):
+        return ((self.channels['freq'] != 0xFFFFFFFF) & (self.attributes != 0xFF)
+                & ((self.attributes & 0x07) != INVALID_BAND))
+
+    def _rows(self, rows):
+        # По умолчанию правим только занятые каналы, пустые слоты не трогаем
+        if rows is None:
+            return np.flatnonzero(self.used())
+        rows = np.asarray(rows, dtype=np.intp).ravel()
+        if rows.size and (rows.min() < 0 or rows.max() >= CHANNEL_COUNT):
+            raise IndexError(f"Номер канала вне диапазона 0..{CHANNEL_COUNT - 1}")
+        return rows
+
+    # ---------------------------
+    # Чтение колонки
+    # ---------------------------
+    def column(self, name, rows=None):
+        rows = np.arange(CHANNEL_COUNT) if rows is None else self._rows(rows)
+        if name == 'name':
+            return [self._decode_name(raw) for raw in self.names['name'][rows]]
+        if name in FREQUENCY_FIELDS:
+            return self.channels[FREQUENCY_FIELDS[name]][rows].astype(np.int64) * 10
+        if name in BYTE_FIELDS:
+            return self.channels[name][rows].copy()
+        if name in BITFIELDS:
+            raw, shift, width = self._bitfield(name)
+            return (raw[rows] >> shift) & ((1 << width) - 1)
+        raise KeyError(name)
+
+    # ---------------------------
+    # Запись колонки (скаляр или массив по строкам)
+    # ---------------------------
+    # Частоты и смещения задаются в Гц и должны быть кратны 10 Гц —
+    # шаг хранения в EEPROM; лишние разряды не округляются, а отклоняются.
+    def set_column(self, name, values, rows=None):
+        if name in READ_ONLY_COLUMNS:
+            raise ValueError(f"Колонка {name} только для чтения")
+        rows = self._rows(rows)
+        if name == 'name':
+            if isinstance(values, str):
+                values = [values] * rows.size
+            self.names['name'][rows] = [self._encode_name(v) for v in values]
+            return
+        values = np.broadcast_to(np.asarray(values, dtype=np.int64), rows.shape)
+        if name in FREQUENCY_FIELDS:
+            self._check_step(name, values)
+        if name == 'frequency':
+            band = self.band_of(values)
+            self.channels['freq'][rows] = values // 10
+            self._write_bits('band', band, rows)
+        elif name == 'offset':
+            raw = values // 10
+            self._check_range(name, raw, 0xFFFFFFFF)
+            self.channels['offset'][rows] = raw
+        elif name in BYTE_FIELDS:
+            self._check_range(name, values, 0xFF)
+            self.channels[name][rows] = values
+        elif name in BITFIELDS:
+            self._write_bits(name, values, rows)
+        else:
+            raise KeyError(name)
+
+    def add_to_column(self, name, delta, rows=None):
+        if name == 'name':
+            raise ValueError("К имени нельзя прибавить число")
+        rows = self._rows(rows)
+        self.set_column(name, self.column(name, rows).astype(np.int64) + delta, rows)
+
+    # ---------------------------
+    # Вспомогательные
+    # ---------------------------
+    @staticmethod
+    def band_of(frequencies):
+        frequencies = np.asarray(frequencies, dtype=np.int64)
+        band = np.searchsorted(BANDS[:, 0], frequencies, side='right') - 1
+        outside = (band < 0) | (frequencies > BANDS[np.maximum(band, 0), 1])
+        if np.any(outside):
+            bad = frequencies[outside].ravel()[0]
+            raise ValueError(f"Частота {bad} Гц вне диапазонов радиостанции")
+        return band
+
+    def _write_bits(self, name, values, rows):
+        raw, shift, width = self._bitfield(name)
+        mask = (1 << width) - 1
+        self._check_range(name, values, mask)
+        keep = 0xFF ^ (mask << shift)
+        raw[rows] = (raw[rows] & keep) | (values << shift)
+
+    def _bitfield(self, name):
+        array, field, shift, width = BITFIELDS[name]
+        raw = getattr(self, array)
+        return (raw[field] if field else raw), shift, width
+
+    @staticmethod
+    def _check_range(name, values, maximum):
+        if values.size and (values.min() < 0 or values.max() > maximum):
+            raise ValueError(f"Значение колонки {name} вне диапазона 0..{maximum}")
+
+    @staticmethod
+    def _check_step(name, values):
+        if np.any(values % 10):
+            bad = values[values % 10 != 0].ravel()[0]
+            raise ValueError(f"Значение колонки {name} не кратно 10 Гц: {bad}")
+
+    @staticmethod
+    def _decode_name(raw):
+        # Прошивка дополняет имя нулями или 0xFF; прочие байты вне ASCII
+        # сохраняются через surrogateescape, чтобы запись имени не портила их
+        return raw.split(b'\x00', 1)[0].split(b'\xff', 1)[0].decode('ascii', errors='surrogateescape')
+
+    @staticmethod
+    def _encode_name(text):
+        try:
+            raw = str(text).encode('ascii', errors='surrogateescape')
+        except UnicodeEncodeError:
+            raise ValueError(f"Имя должно содержать только символы ASCII: {text}") from None
+        if len(raw) > NAME_LENGTH:
+            raise ValueError(f"Имя длиннее {NAME_LENGTH} символов: {text}")
+        return raw
@@ -12,13 +12,16 @@ from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QTextEdit, QProgressBar, QLabel, QLineEdit, QFileDialog,
     QComboBox, QMenuBar, QMenu, QMessageBox, QRadioButton,
-    QButtonGroup, QGroupBox, QCompleter, QDialog, QTextBrowser
+    QButtonGroup, QGroupBox, QCompleter, QDialog, QTextBrowser,
+    QTableWidget, QTableWidgetItem, QTabWidget
 )
 from PySide6.QtCore import (
     QProcess, Qt, QSettings, QByteArray, QTimer, QStringListModel, QUrl
 )
 from PySide6.QtGui import QTextCursor, QDesktopServices, QKeySequence, QAction
 
+from eeprom_channels import ChannelTable, COLUMNS, CHOICES, FREQUENCY_FIELDS, READ_ONLY_COLUMNS
+
 VERSION = "1.1"
 
 # ---------------------------
@@ -89,6 +92,28 @@ class K5ToolGUI(QMainWindow):
                 'rb_write_full': "Write Full EEPROM Dump",
                 'rb_write_cal': "Write Calibration Dump",
                 'btn_write_eeprom': "Запись EEPROM",
+                'btn_channels': "Каналы",
+                'dlg_channels_title': "Редактор каналов EEPROM",
+                'btn_open_dump': "Открыть дамп",
+                'btn_save_dump': "Сохранить дамп",
+                'label_no_dump': "Дамп не загружен",
+                'tab_channels': "Каналы",
+                'tab_settings': "Настройки",
+                'bulk_set': "Установить",
+                'bulk_add': "Прибавить",
+                'btn_apply': "Применить",
+                'bulk_placeholder': "Значение (частоты в МГц)",
+                'msg_bad_value': "Неверное значение: {error}",
+                'msg_empty_value': "пустое значение",
+                'columns': {
+                    'name': "Имя", 'frequency': "Частота, МГц", 'offset': "Смещение, МГц",
+                    'shift': "Сдвиг", 'power': "Мощность", 'modulation': "Модуляция",
+                    'bandwidth': "Полоса", 'rx_code_type': "Тип кода RX", 'rxcode': "Код RX",
+                    'tx_code_type': "Тип кода TX", 'txcode': "Код TX", 'step': "Шаг",
+                    'scrambler': "Скремблер", 'busy_lock': "Блок. занятого", 'reverse': "Реверс",
+                    'dtmf_decode': "DTMF декод.", 'ptt_id': "PTT ID", 'scanlist1': "Скан. 1",
+                    'scanlist2': "Скан. 2", 'compander': "Компандер", 'band': "Диапазон",
+                },
                 'args_placeholder': "Аргументы командной строки",
                 'btn_start': "▶ Старт",
                 'btn_stop': "■ Стоп",
@@ -152,6 +177,28 @@ class K5ToolGUI(QMainWindow):
                 'rb_write_full': "Write Full EEPROM Dump",
                 'rb_write_cal': "Write Calibration Dump",
                 'btn_write_eeprom': "Write EEPROM",
+                'btn_channels': "Channels",
+                'dlg_channels_title': "EEPROM Channel Editor",
+                'btn_open_dump': "Open Dump",
+                'btn_save_dump': "Save Dump",
+                'label_no_dump': "No dump loaded",
+                'tab_channels': "Channels",
+                'tab_settings': "Settings",
+                'bulk_set': "Set",
+                'bulk_add': "Add",
+                'btn_apply': "Apply",
+                'bulk_placeholder': "Value (frequencies in MHz)",
+                'msg_bad_value': "Invalid value: {error}",
+                'msg_empty_value': "empty value",
+                'columns': {
+                    'name': "Name", 'frequency': "Frequency, MHz", 'offset': "Offset, MHz",
+                    'shift': "Shift", 'power': "Power", 'modulation': "Modulation",
+                    'bandwidth': "Bandwidth", 'rx_code_type': "RX Code Type", 'rxcode': "RX Code",
+                    'tx_code_type': "TX Code Type", 'txcode': "TX Code", 'step': "Step",
+                    'scrambler': "Scrambler", 'busy_lock': "Busy Lock", 'reverse': "Reverse",
+                    'dtmf_decode': "DTMF Decode", 'ptt_id': "PTT ID", 'scanlist1': "Scan List 1",
+                    'scanlist2': "Scan List 2", 'compander': "Compander", 'band': "Band",
+                },
                 'args_placeholder': "Command-line arguments",
                 'btn_start': "▶ Start",
                 'btn_stop': "■ Stop",
@@ -311,6 +358,10 @@ class K5ToolGUI(QMainWindow):
         read_layout.addWidget(self.read_full_rb)
         read_layout.addWidget(self.read_cal_rb)
         read_layout.addWidget(self.read_eeprom_button)
+        self.channels_button = QPushButton(self.trans['btn_channels'])
+        self.channels_button.setFixedWidth(110)
+        self.channels_button.clicked.connect(self.open_channel_editor)
+        read_layout.addWidget(self.channels_button)
         main_layout.addWidget(read_group)
 
         # Запись EEPROM
@@ -627,6 +678,21 @@ class K5ToolGUI(QMainWindow):
     def check_updates(self):
         QDesktopServices.openUrl(QUrl("https://github.com/iwizard7/k5toolGUI/releases"))
 
+    # ---------------------------
+    # Редактор каналов из дампа EEPROM
+    # ---------------------------
+    def open_channel_editor(self):
+        dlg = ChannelEditorDialog(self.trans, self)
+        dlg.exec()
+        if dlg.saved_path:
+            self.log(f"EEPROM dump saved to {dlg.saved_path}")
+            port = self.port_combo.currentText().strip()
+            if not port:
+                self.args_input.setText(f"-wree {dlg.saved_path}")
+                QMessageBox.warning(self, self.trans['menu_settings'], self.trans['msg_no_port'])
+                return
+            self.args_input.setText(f"-port {port} -wree {dlg.saved_path}")
+
     # ---------------------------
     # Справка и About
     # ---------------------------
@@ -651,6 +717,173 @@ class K5ToolGUI(QMainWindow):
         settings.setValue("geometry", self.saveGeometry())
         super().closeEvent(event)
 
+# ---------------------------
+# Диалог редактирования каналов
+# ---------------------------
+class ChannelEditorDialog(QDialog):
+    def __init__(self, trans, parent=None):
+        super().__init__(parent)
+        self.trans = trans
+        self.channels = None
+        self.rows = []
+        self.saved_path = None
+        self.setWindowTitle(self.trans['dlg_channels_title'])
+        self.resize(900, 600)
+        layout = QVBoxLayout(self)
+
+        # Файл дампа
+        file_layout = QHBoxLayout()
+        open_btn = QPushButton(self.trans['btn_open_dump'])
+        open_btn.clicked.connect(self.open_dump)
+        self.save_btn = QPushButton(self.trans['btn_save_dump'])
+        self.save_btn.setEnabled(False)
+        self.save_btn.clicked.connect(self.save_dump)
+        self.file_label = QLabel(self.trans['label_no_dump'])
+        file_layout.addWidget(open_btn)
+        file_layout.addWidget(self.save_btn)
+        file_layout.addWidget(self.file_label)
+        file_layout.addStretch()
+        layout.addLayout(file_layout)
+
+        # Таблицы каналов и настроек
+        self.tabs = QTabWidget()
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels([self.trans['columns'][name] for name in COLUMNS])
+        self.table.itemChanged.connect(self._on_channel_changed)
+        self.settings_table = QTableWidget(0, 1)
+        self.settings_table.horizontalHeader().setVisible(False)
+        self.settings_table.itemChanged.connect(self._on_setting_changed)
+        self.tabs.addTab(self.table, self.trans['tab_channels'])
+        self.tabs.addTab(self.settings_table, self.trans['tab_settings'])
+        layout.addWidget(self.tabs)
+
+        # Групповое изменение колонки (выделенные строки или все занятые каналы)
+        bulk_layout = QHBoxLayout()
+        self.bulk_column = QComboBox()
+        for name in COLUMNS:
+            if name not in READ_ONLY_COLUMNS:
+                self.bulk_column.addItem(self.trans['columns'][name], name)
+        self.bulk_mode = QComboBox()
+        self.bulk_mode.addItem(self.trans['bulk_set'], 'set')
+        self.bulk_mode.addItem(self.trans['bulk_add'], 'add')
+        self.bulk_value = QLineEdit()
+        self.bulk_value.setPlaceholderText(self.trans['bulk_placeholder'])
+        self.apply_btn = QPushButton(self.trans['btn_apply'])
+        self.apply_btn.setEnabled(False)
+        self.apply_btn.clicked.connect(self.apply_bulk)
+        bulk_layout.addWidget(self.bulk_column)
+        bulk_layout.addWidget(self.bulk_mode)
+        bulk_layout.addWidget(self.bulk_value)
+        bulk_layout.addWidget(self.apply_btn)
+        layout.addLayout(bulk_layout)
+
+    def open_dump(self):
+        path, _ = QFileDialog.getOpenFileName(self, self.trans['btn_open_dump'], filter="*.raw *.bin")
+        if not path:
+            return
+        try:
+            self.channels = ChannelTable.from_file(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, self.trans['dlg_channels_title'], str(e))
+            return
+        self.file_label.setText(os.path.basename(path))
+        self.save_btn.setEnabled(True)
+        self.apply_btn.setEnabled(True)
+        self._fill_tables()
+
+    def save_dump(self):
+        path, _ = QFileDialog.getSaveFileName(self, self.trans['btn_save_dump'], filter="*.raw *.bin")
+        if not path:
+            return
+        try:
+            self.channels.save(path)
+        except OSError as e:
+            QMessageBox.critical(self, self.trans['dlg_channels_title'], str(e))
+            return
+        self.saved_path = path
+        self.file_label.setText(os.path.basename(path))
+
+    def apply_bulk(self):
+        name = self.bulk_column.currentData()
+        selected = sorted({index.row() for index in self.table.selectedIndexes()})
+        rows = [self.rows[r] for r in selected] if selected else None
+        try:
+            value = self._parse(name, self.bulk_value.text())
+            if self.bulk_mode.currentData() == 'add':
+                self.channels.add_to_column(name, value, rows)
+            else:
+                self.channels.set_column(name, value, rows)
+        except (ValueError, IndexError) as e:
+            QMessageBox.warning(self, self.trans['dlg_channels_title'],
+                                self.trans['msg_bad_value'].format(error=e))
+        self._fill_tables()
+
+    def _fill_tables(self):
+        self.rows = [int(r) for r in self.channels.used().nonzero()[0]]
+        self.table.blockSignals(True)
+        self.table.setRowCount(len(self.rows))
+        self.table.setVerticalHeaderLabels([str(r + 1) for r in self.rows])
+        for col, name in enumerate(COLUMNS):
+            for row, value in enumerate(self.channels.column(name, self.rows)):
+                item = QTableWidgetItem(self._format(name, value))
+                if name in READ_ONLY_COLUMNS:
+                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+                self.table.setItem(row, col, item)
+        self.table.blockSignals(False)
+
+        names = self.channels.settings.dtype.names
+        self.settings_table.blockSignals(True)
+        self.settings_table.setRowCount(len(names))
+        self.settings_table.setVerticalHeaderLabels(names)
+        for row, name in enumerate(names):
+            self.settings_table.setItem(row, 0, QTableWidgetItem(str(self.channels.settings[name][0])))
+        self.settings_table.blockSignals(False)
+
+    def _on_channel_changed(self, item):
+        name = COLUMNS[item.column()]
+        try:
+            self.channels.set_column(name, self._parse(name, item.text()), [self.rows[item.row()]])
+        except (ValueError, IndexError) as e:
+            QMessageBox.warning(self, self.trans['dlg_channels_title'],
+                                self.trans['msg_bad_value'].format(error=e))
+        # Перерисовка откладывается: нельзя менять ячейки внутри их сигнала
+        QTimer.singleShot(0, self._fill_tables)
+
+    def _on_setting_changed(self, item):
+        name = self.channels.settings.dtype.names[item.row()]
+        try:
+            value = int(item.text(), 0)
+            if not 0 <= value <= 0xFF:
+                raise ValueError(item.text())
+            self.channels.settings[name] = value
+        except ValueError as e:
+            QMessageBox.warning(self, self.trans['dlg_channels_title'],
+                                self.trans['msg_bad_value'].format(error=e))
+        QTimer.singleShot(0, self._fill_tables)
+
+    @staticmethod
+    def _format(name, value):
+        if name == 'name':
+            # Байты вне ASCII показываются как «�»; в дампе они не меняются
+            return value.encode('ascii', errors='surrogateescape').decode('ascii', errors='replace')
+        if name in FREQUENCY_FIELDS:
+            return f"{value / 1e6:.5f}"
+        if name in CHOICES and value < len(CHOICES[name]):
+            return CHOICES[name][value]
+        return str(value)
+
+    def _parse(self, name, text):
+        text = text.strip()
+        if name == 'name':
+            return text
+        if name in CHOICES and text in CHOICES[name]:
+            return CHOICES[name].index(text)
+        if not text:
+            raise ValueError(self.trans['msg_empty_value'])
+        if name in FREQUENCY_FIELDS:
+            return round(float(text) * 1e6)
+        return int(text, 0)
+
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     window = K5ToolGUI()
@@ -0,0 +1,188 @@
+import numpy as np
+import pytest
+
+from eeprom_channels import (
+    ChannelTable, COLUMNS, READ_ONLY_COLUMNS, CHANNEL_COUNT, DUMP_SIZE,
+    ATTRIBUTES_OFFSET, NAMES_OFFSET,
+)
+
+CALIBRATION = slice(0x1E00, 0x2000)
+
+# Каналы с заранее известными значениями: (номер, частота Гц, смещение Гц, имя, мощность, диапазон)
+KNOWN_CHANNELS = [
+    (0, 145_500_000, 600_000, 'CALL', 2, 2),
+    (1, 433_500_000, 0, 'PMR', 0, 5),
+    (7, 446_006_250, 0, 'PMR1', 1, 5),
+    (199, 60_000_000, 1_000_000, 'LOW', 2, 0),
+]
+
+# Слот с частотой, но с диапазоном 7 — прошивка считает канал недействительным
+INVALID_ROW = 3
+
+
+def random_dump(seed):
+    rng = np.random.default_rng(seed)
+    return bytes(rng.integers(0, 256, DUMP_SIZE, dtype=np.uint8))
+
+
+def blank_dump():
+    return b'\xff' * DUMP_SIZE
+
+
+def known_dump():
+    data = bytearray(blank_dump())
+    data[CALIBRATION] = bytes(range(256)) * 2
+    for row, freq, offset, name, power, band in KNOWN_CHANNELS:
+        raw = bytearray(16)
+        raw[0:4] = (freq // 10).to_bytes(4, 'little')
+        raw[4:8] = (offset // 10).to_bytes(4, 'little')
+        raw[12] = power << 2
+        data[row * 16:row * 16 + 16] = raw
+        data[ATTRIBUTES_OFFSET + row] = 0xC0 | band
+        data[NAMES_OFFSET + row * 16:NAMES_OFFSET + row * 16 + len(name)] = name.encode()
+        data[NAMES_OFFSET + row * 16 + len(name):NAMES_OFFSET + row * 16 + 10] = b'\x00' * (10 - len(name))
+    data[INVALID_ROW * 16:INVALID_ROW * 16 + 8] = bytes(8)
+    data[ATTRIBUTES_OFFSET + INVALID_ROW] = 0xC7
+    return bytes(data)
+
+
+CORPUS = {f'random{seed}': random_dump(seed) for seed in range(5)}
+CORPUS.update(blank=blank_dump(), known=known_dump())
+
+
+@pytest.mark.parametrize('data', CORPUS.values(), ids=CORPUS.keys())
+@pytest.mark.parametrize('name', [c for c in COLUMNS if c not in ('name', 'frequency') + READ_ONLY_COLUMNS])
+def test_column_round_trip(data, name):
+    table = ChannelTable(data)
+    rows = range(CHANNEL_COUNT)
+    table.set_column(name, table.column(name, rows), rows)
+    assert table.to_bytes() == data
+
+
+def test_name_and_frequency_round_trip():
+    data = known_dump()
+    table = ChannelTable(data)
+    rows = [row for row, *_ in KNOWN_CHANNELS]
+    table.set_column('frequency', table.column('frequency', rows), rows)
+    table.set_column('name', table.column('name', rows), rows)
+    assert table.to_bytes() == data
+
+
+def test_known_values_decode():
+    table = ChannelTable(known_dump())
+    rows = [row for row, *_ in KNOWN_CHANNELS]
+    assert list(table.column('frequency', rows)) == [c[1] for c in KNOWN_CHANNELS]
+    assert list(table.column('offset', rows)) == [c[2] for c in KNOWN_CHANNELS]
+    assert table.column('name', rows) == [c[3] for c in KNOWN_CHANNELS]
+    assert list(table.column('power', rows)) == [c[4] for c in KNOWN_CHANNELS]
+    assert list(table.column('band', rows)) == [c[5] for c in KNOWN_CHANNELS]
+    assert list(np.flatnonzero(table.used())) == rows
+
+
+def test_invalid_band_is_not_used():
+    data = known_dump()
+    table = ChannelTable(data)
+    assert not table.used()[INVALID_ROW]
+    table.set_column('power', 1)
+    assert table.to_bytes()[INVALID_ROW * 16:INVALID_ROW * 16 + 16] == data[INVALID_ROW * 16:INVALID_ROW * 16 + 16]
+
+
+def test_blank_dump_has_no_used_channels():
+    table = ChannelTable(blank_dump())
+    assert not table.used().any()
+    table.add_to_column('offset', 100_000)
+    assert table.to_bytes() == blank_dump()
+
+
+def test_set_column_touches_only_target_bits():
+    data = known_dump()
+    table = ChannelTable(data)
+    table.set_column('power', 1)
+    out = np.frombuffer(table.to_bytes(), np.uint8)
+    diff = np.flatnonzero(out != np.frombuffer(data, np.uint8))
+    assert set(diff) <= {row * 16 + 12 for row, *_ in KNOWN_CHANNELS}
+    assert all((int(out[i]) ^ data[i]) & ~0x0C == 0 for i in diff)
+    assert table.to_bytes()[CALIBRATION] == data[CALIBRATION]
+
+
+def test_add_to_column_touches_only_target_bytes():
+    data = known_dump()
+    table = ChannelTable(data)
+    table.add_to_column('offset', 5_000)
+    assert list(table.column('offset', [0, 1])) == [605_000, 5_000]
+    diff = np.flatnonzero(np.frombuffer(table.to_bytes(), np.uint8) != np.frombuffer(data, np.uint8))
+    assert all(4 <= i % 16 < 8 and i < CHANNEL_COUNT * 16 for i in diff)
+    assert table.to_bytes()[CALIBRATION] == data[CALIBRATION]
+
+
+def test_frequency_updates_band():
+    table = ChannelTable(known_dump())
+    table.set_column('frequency', 435_000_000, [0])
+    assert table.column('band', [0])[0] == 5
+    assert table.attributes[0] == 0xC5
+    table.add_to_column('frequency', -290_000_000, [0])
+    assert table.column('band', [0])[0] == 2
+
+
+def test_band_is_read_only():
+    data = known_dump()
+    table = ChannelTable(data)
+    with pytest.raises(ValueError):
+        table.set_column('band', 6, [0])
+    with pytest.raises(ValueError):
+        table.add_to_column('band', 1)
+    assert table.to_bytes() == data
+
+
+@pytest.mark.parametrize('name', ['frequency', 'offset'])
+def test_frequency_not_multiple_of_10_hz_rejected(name):
+    data = known_dump()
+    table = ChannelTable(data)
+    with pytest.raises(ValueError):
+        table.set_column(name, 145_500_007, [0])
+    assert table.to_bytes() == data
+
+
+def test_non_ascii_name_rejected():
+    table = ChannelTable(known_dump())
+    with pytest.raises(ValueError):
+        table.set_column('name', 'Тест', [0])
+    assert table.column('name', [0]) == ['CALL']
+
+
+def test_non_ascii_name_bytes_round_trip():
+    data = bytearray(known_dump())
+    data[NAMES_OFFSET:NAMES_OFFSET + 4] = b'C\x80\xfeL'
+    table = ChannelTable(bytes(data))
+    table.set_column('name', table.column('name', [0]), [0])
+    assert table.to_bytes() == bytes(data)
+
+
+@pytest.mark.parametrize('frequency', [0, 49_999_990, 90_000_000, 600_000_010])
+def test_frequency_outside_bands_rejected(frequency):
+    data = known_dump()
+    table = ChannelTable(data)
+    with pytest.raises(ValueError):
+        table.set_column('frequency', frequency, [0])
+    assert table.to_bytes() == data
+
+
+def test_range_and_index_checks():
+    table = ChannelTable(known_dump())
+    with pytest.raises(ValueError):
+        table.set_column('power', 4)
+    with pytest.raises(ValueError):
+        table.set_column('step', -1)
+    with pytest.raises(ValueError):
+        table.set_column('name', 'ABCDEFGHIJK', [0])
+    with pytest.raises(ValueError):
+        table.add_to_column('name', 1)
+    with pytest.raises(IndexError):
+        table.set_column('power', 0, [CHANNEL_COUNT])
+    with pytest.raises(KeyError):
+        table.column('unknown')
+
+
+def test_short_dump_rejected():
+    with pytest.raises(ValueError):
+        ChannelTable(b'\xff' * (DUMP_SIZE - 1))